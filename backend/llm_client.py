@@ -2,7 +2,6 @@ import os
 import json
 import logging
 import time
-from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +90,8 @@ def explain_changes(changes: list) -> str | dict:
     partial_failure = False
 
     try:
+        from openai import OpenAI  # Lazy import (cold start)
+
         client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=api_key,
@@ -3,31 +3,38 @@ from dotenv import load_dotenv
 import logging
 import asyncio
 import time
+import os
+
+# Startup tuning flags set in the process environment win over backend/.env
+STARTUP_FLAGS = ("PREWARM_IMPORTS", "PREWARM_DELAY_SECONDS", "PROFILE_STARTUP")
+_startup_env = {k: os.environ[k] for k in STARTUP_FLAGS if k in os.environ}
 
 # Load env vars with override to fix precedence issues
 load_dotenv(Path(__file__).parent / ".env", override=True)
+os.environ.update(_startup_env)
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
 
+# Opt-in cold start profile: time every import made while loading this module
+PROFILE_STARTUP = os.getenv("PROFILE_STARTUP", "false").lower() == "true"
+if PROFILE_STARTUP:
+    import startup_profile
+    startup_profile.install()
+
 from fastapi import FastAPI, UploadFile, File, HTTPException, Body
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-import json
-import difflib
-import requests
+import importlib
 import re
-import fitz  # PyMuPDF
-import os
 import uuid
-from fpdf import FPDF
-from openai import OpenAI
 
-# Isolated LLM clients (imported after env/logging setup)
-from llm_client import explain_changes
-from task_client import generate_compliance_task
+# Heavy dependencies (fitz, fpdf, openai, difflib) and the LLM client modules
+# are imported on first use so a cold start only pays for FastAPI itself.
+# They are optionally pre-warmed in the background once the server is up.
+PREWARM_MODULES = ("difflib", "fitz", "fpdf", "openai", "llm_client", "task_client")
 
 app = FastAPI(title="RegLens Backend")
 
@@ -69,6 +76,7 @@ MAX_CHANGES_FOR_LLM = 10
 MAX_TEXT_LEN = 300
 
 def extract_pdf_text(path: Path) -> str:
+    import fitz  # PyMuPDF
     doc = fitz.open(path)
     text = "\n".join(page.get_text("text") for page in doc)
     doc.close()
@@ -108,6 +116,7 @@ def align_sections(old, new):
     return [(k, old[k], new[k]) for k in set(old) & set(new)]
 
 def diff_sections(aligned):
+    import difflib
     diffs = []
     for anchor, o, n in aligned:
         for line in difflib.unified_diff(o, n, lineterm=""):
@@ -168,9 +177,63 @@ async def cleanup_loop():
                 LAST_ANALYSIS_CHANGES.clear()
                 logging.info("In-memory state cleared due to inactivity watchdog.")
 
+# Strong references so background tasks aren't garbage-collected mid-run
+BACKGROUND_TASKS = set()
+
+def _on_background_task_done(task: asyncio.Task):
+    BACKGROUND_TASKS.discard(task)
+    if not task.cancelled() and task.exception():
+        logging.error(f"Background task {task.get_name()} failed: {task.exception()!r}")
+
+def spawn_background_task(coro, name: str):
+    task = asyncio.create_task(coro, name=name)
+    BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
 @app.on_event("startup")
 async def start_cleanup_task():
-    asyncio.create_task(cleanup_loop())
+    spawn_background_task(cleanup_loop(), "cleanup_loop")
+
+def prewarm_imports(profile: bool = False):
+    """Import deferred modules ahead of first use; optionally log their timings."""
+    timings = []
+    for name in PREWARM_MODULES:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            logging.warning(f"Pre-warm import of '{name}' failed: {e}")
+            continue
+        timings.append((name, (time.perf_counter() - start) * 1000))
+
+    if profile:
+        for name, ms in timings:
+            logging.info(f"[startup-profile] pre-warm {name:<14} {ms:8.1f} ms")
+        logging.info(f"[startup-profile] pre-warm total         {sum(ms for _, ms in timings):8.1f} ms")
+    return timings
+
+async def prewarm_loop(delay: float, profile: bool):
+    # Yield briefly so uvicorn starts listening before we compete for the GIL
+    await asyncio.sleep(delay)
+    await asyncio.to_thread(prewarm_imports, profile)
+
+@app.on_event("startup")
+async def start_prewarm_task():
+    if PROFILE_STARTUP:
+        startup_profile.log_ready()
+
+    # Pre-warming is on by default; disable with PREWARM_IMPORTS=false
+    if os.getenv("PREWARM_IMPORTS", "true").lower() != "true":
+        return
+
+    raw_delay = os.getenv("PREWARM_DELAY_SECONDS", "1")
+    try:
+        delay = max(0.0, float(raw_delay))
+    except ValueError:
+        logging.warning(f"Invalid PREWARM_DELAY_SECONDS={raw_delay!r}; using 1 second")
+        delay = 1.0
+    spawn_background_task(prewarm_loop(delay, PROFILE_STARTUP), "prewarm_imports")
 
 # Task generation logic is decoupled via task_client.py
 
@@ -181,6 +244,8 @@ def test_openrouter():
         if not api_key:
             return {"status": "error", "message": "Missing OPENROUTER_API_KEY env var"}
 
+        from openai import OpenAI  # Lazy import (cold start)
+
         client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=api_key
@@ -269,6 +334,7 @@ async def analyze(old: UploadFile = File(...), new: UploadFile = File(...)):
             compressed = compress_changes(raw)
 
             # Delegate to isolated LLM client
+            from llm_client import explain_changes
             explanation = explain_changes(compressed)
 
             # Store changes for subsequent task generation call
@@ -305,6 +371,8 @@ def generate_tasks_llm(body: dict = Body(None)):
     if not changes:
         return {"status": "success", "count": 0, "tasks": []}
 
+    from task_client import generate_compliance_task
+
     for change in changes:
         try:
             task_data = generate_compliance_task(change)
@@ -356,6 +424,7 @@ async def export_tasks_pdf(regulation_name: str = "RegLens Compliance Audit"):
         if not txt: return ""
         return str(txt).encode("latin-1", "replace").decode("latin-1").replace("?", " ")
 
+    from fpdf import FPDF
     pdf = FPDF()
     pdf.add_page()
     pdf.set_font("Arial", "B", 20)
@@ -418,3 +487,7 @@ async def export_tasks_pdf(regulation_name: str = "RegLens Compliance Audit"):
         filename="compliance_report.pdf",
         background=background_tasks
     )
+
+# End of module-level imports; stop the profiler before the server imports more
+if PROFILE_STARTUP:
+    startup_profile.report()
@@ -0,0 +1,66 @@
+import builtins
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_original_import = builtins.__import__
+_local = threading.local()
+_timings = {}
+_started_at = None
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """Attribute the cumulative cost of each outermost new import to its top-level package."""
+    depth = getattr(_local, "depth", 0)
+    if depth or level or name in sys.modules:
+        _local.depth = depth + 1
+        try:
+            return _original_import(name, globals, locals, fromlist, level)
+        finally:
+            _local.depth = depth
+
+    before = len(sys.modules)
+    start = time.perf_counter()
+    _local.depth = 1
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _local.depth = 0
+        root = name.partition(".")[0]
+        ms, count = _timings.get(root, (0.0, 0))
+        _timings[root] = (
+            ms + (time.perf_counter() - start) * 1000,
+            count + len(sys.modules) - before,
+        )
+
+
+def install():
+    """Start recording import timings. Call before the imports you want to measure."""
+    global _started_at
+    _started_at = time.perf_counter()
+    builtins.__import__ = _timed_import
+
+
+def report() -> list:
+    """Stop recording and log per-package import cost, slowest first."""
+    builtins.__import__ = _original_import
+    if _started_at is None:
+        return []
+
+    rows = sorted(_timings.items(), key=lambda kv: kv[1][0], reverse=True)
+    for root, (ms, count) in rows:
+        logger.info(f"[startup-profile] import {root:<16} {ms:8.1f} ms  ({count} modules)")
+    total = (time.perf_counter() - _started_at) * 1000
+    logger.info(f"[startup-profile] imports done in      {total:8.1f} ms")
+    return rows
+
+
+def log_ready():
+    """Log time from install() until the app finished starting up."""
+    if _started_at is None:
+        return
+    total = (time.perf_counter() - _started_at) * 1000
+    logger.info(f"[startup-profile] app ready in         {total:8.1f} ms")
@@ -1,7 +1,6 @@
 import os
 import json
 import logging
-from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +19,8 @@ def generate_compliance_task(change: dict) -> dict | None:
     model = os.getenv("OPENROUTER_MODEL", "openai/gpt-oss-120b:free")
 
     try:
+        from openai import OpenAI  # Lazy import (cold start)
+
         client = OpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=api_key,
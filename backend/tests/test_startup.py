@@ -0,0 +1,78 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that must stay off the cold start path (see PREWARM_MODULES in main.py)
+DEFERRED_MODULES = ["fitz", "fpdf", "openai", "llm_client", "task_client"]
+
+# Budget for what `import main` adds on top of FastAPI itself. The lazy tree
+# measures ~27 modules / ~0.05 s; eager heavy imports cost ~950 / ~1 s.
+MAX_EXTRA_MODULES = 100
+MAX_EXTRA_SECONDS = 0.5
+
+
+def run_backend(code: str, cwd: Path = BACKEND_DIR, **env) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        env={**os.environ, "PREWARM_IMPORTS": "false", **env},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_import_main_defers_heavy_modules():
+    code = (
+        "import json, sys, time\n"
+        "import dotenv, fastapi, fastapi.responses, fastapi.middleware.cors\n"
+        "baseline = len(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        "import main\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]\n"
+        "extra = len(sys.modules) - baseline\n"
+        "print(json.dumps({'loaded': loaded, 'extra': extra, 'elapsed': elapsed}))\n"
+    )
+    result = run_backend(code)
+    assert result.returncode == 0, result.stderr
+
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    assert data["loaded"] == []
+    assert data["extra"] <= MAX_EXTRA_MODULES
+    assert data["elapsed"] < MAX_EXTRA_SECONDS
+
+
+def test_profile_startup_reports_without_prewarm():
+    code = (
+        "import main\n"
+        "from fastapi.testclient import TestClient\n"
+        "with TestClient(main.app) as client:\n"
+        "    client.get('/')\n"
+    )
+    result = run_backend(code, PROFILE_STARTUP="true")
+    assert result.returncode == 0, result.stderr
+
+    assert "[startup-profile] import fastapi" in result.stderr
+    assert "[startup-profile] app ready in" in result.stderr
+    # Imports made by the server after main finished loading are not attributed to it
+    assert "[startup-profile] import queue" not in result.stderr
+
+
+def test_process_env_overrides_dotenv_startup_flags(tmp_path):
+    for name in ("main.py", "startup_profile.py"):
+        shutil.copy(BACKEND_DIR / name, tmp_path / name)
+    (tmp_path / ".env").write_text("PROFILE_STARTUP=false\nPREWARM_IMPORTS=true\n")
+
+    result = run_backend(
+        "import main; print(main.PROFILE_STARTUP)",
+        cwd=tmp_path,
+        PROFILE_STARTUP="true",
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "True"